@@ -26,11 +26,12 @@ bl_info = {
 }
 
 import hashlib
+import itertools
 import os
 import re
 import shutil
 import uuid
-from collections import defaultdict
+from collections import Counter
 
 import bpy
 from bpy.props import (
@@ -55,24 +56,68 @@ DEFAULT_HEADER_LINES = [
 ]
 _ASSET_LIBRARY_ENUM_CACHE = []
 
+# Compiled once at import; these run per datablock and per path segment in
+# _build_assignment_plan, so skipping the re cache lookup matters there.
+_RE_WS = re.compile(r"\s+")
+_RE_UNSAFE = re.compile(r"[^A-Za-z0-9._-]")
+_RE_MULTI_UNDER = re.compile(r"_+")
+_SEP_TRANSLATE = str.maketrans("\\", "/")
+# ASCII characters _RE_UNSAFE would replace, as a translate table; translate
+# runs as a C loop without match objects. Non-ASCII input (which the table
+# cannot cover) falls back to the regex.
+_UNSAFE_TRANSLATE = str.maketrans(
+    {chr(code): "_" for code in range(128) if _RE_UNSAFE.match(chr(code))}
+)
+
+# The type segments are fixed, already-safe strings; mapping them directly
+# avoids re-running _safe_segment once per datablock. Buckets are stored as
+# bpy.data attribute names because bpy.data is restricted at import time.
+_TYPE_SEGMENT_SAFE = {
+    "Materials": "Materials",
+    "Node_Groups": "Node_Groups",
+    "Objects": "Objects",
+    "Collections": "Collections",
+}
+_TARGET_TYPE_BUCKETS = {
+    "ALL": (
+        ("Materials", "materials"),
+        ("Node_Groups", "node_groups"),
+        ("Objects", "objects"),
+        ("Collections", "collections"),
+    ),
+    "MATERIALS": (("Materials", "materials"),),
+    "NODE_GROUPS": (("Node_Groups", "node_groups"),),
+    "OBJECTS_COLLECTIONS": (("Objects", "objects"), ("Collections", "collections")),
+}
+
 
 def _normalize_path_fragment(value):
     cleaned = value.replace("\\", "/").strip()
-    cleaned = re.sub(r"/{2,}", "/", cleaned)
+    # Typical inputs hold zero or one doubled slash; the C-level substring
+    # check plus replace beats running the regex state machine for those.
+    while "//" in cleaned:
+        cleaned = cleaned.replace("//", "/")
     return cleaned.strip("/")
 
 
 def _safe_segment(value):
-    token = re.sub(r"\s+", "_", value.strip())
-    token = re.sub(r"[^A-Za-z0-9._-]", "_", token)
-    token = re.sub(r"_+", "_", token).strip("_")
+    token = _RE_WS.sub("_", value.strip())
+    if token.isascii():
+        token = token.translate(_UNSAFE_TRANSLATE)
+    else:
+        token = _RE_UNSAFE.sub("_", token)
+    token = _RE_MULTI_UNDER.sub("_", token).strip("_")
     return token or "Uncategorized"
 
 
 def _pretty_catalog_leaf(value):
-    leaf = value.split("/")[-1]
+    leaf = value.rsplit("/", 1)[-1]
+    # Most leaves are already a clean single word; skip the replace/collapse
+    # pipeline for those and only fall through when separators are present.
+    if leaf and "_" not in leaf and "-" not in leaf and _RE_WS.search(leaf) is None:
+        return leaf.title()
     leaf = leaf.replace("_", " ").replace("-", " ")
-    leaf = re.sub(r"\s+", " ", leaf).strip()
+    leaf = _RE_WS.sub(" ", leaf).strip()
     if not leaf:
         return "Uncategorized"
     return leaf.title()
@@ -96,9 +141,28 @@ def _addon_prefs(context):
     return addon.preferences
 
 
+# Blender re-runs the library enum callback on every UI redraw; these caches
+# keep path normalization and digesting off the repaint path. Keyed by the raw
+# preference strings, cleared on register()/unregister().
+_ABS_PATH_CACHE = {}
+_ITEM_ID_CACHE = {}
+
+
+def _abs_lib_path(raw_path):
+    abs_path = _ABS_PATH_CACHE.get(raw_path)
+    if abs_path is None:
+        abs_path = os.path.abspath(bpy.path.abspath(raw_path).strip())
+        _ABS_PATH_CACHE[raw_path] = abs_path
+    return abs_path
+
+
 def _library_item_id_for_path(abs_path):
-    digest = hashlib.sha1(abs_path.encode("utf-8")).hexdigest()[:12].upper()
-    return f"{REGISTERED_LIBRARY_PREFIX}{digest}"
+    item_id = _ITEM_ID_CACHE.get(abs_path)
+    if item_id is None:
+        digest = hashlib.blake2b(abs_path.encode("utf-8"), digest_size=6).hexdigest().upper()
+        item_id = f"{REGISTERED_LIBRARY_PREFIX}{digest}"
+        _ITEM_ID_CACHE[abs_path] = item_id
+    return item_id
 
 
 def _asset_library_items(self, context):
@@ -121,7 +185,7 @@ def _asset_library_items(self, context):
 
     used_ids = {MANUAL_LIBRARY_KEY}
     for lib in libs:
-        lib_path = os.path.abspath(bpy.path.abspath(lib.path).strip())
+        lib_path = _abs_lib_path(lib.path)
         if not lib_path:
             continue
 
@@ -148,7 +212,7 @@ def _resolve_registered_library_root(context, prefs):
     filepaths = getattr(preferences, "filepaths", None)
     libs = getattr(filepaths, "asset_libraries", []) if filepaths is not None else []
     for lib in libs:
-        candidate = os.path.abspath(bpy.path.abspath(lib.path).strip())
+        candidate = _abs_lib_path(lib.path)
         candidate_id = _library_item_id_for_path(candidate)
         if candidate_id == prefs.asset_library_name:
             return candidate
@@ -190,68 +254,89 @@ def _delimiter_token(delimiter_enum):
     return mapping[delimiter_enum]
 
 
-def _prefix_from_name(name, delimiter_enum):
+def _make_prefix_head_fn(delimiter_enum):
+    # Binds the delimiter branch once per plan build so the per-datablock
+    # work is a single split call with no enum compare.
     delim = _delimiter_token(delimiter_enum)
     if delim == " ":
-        head = name.split()[0] if name.split() else name
-    else:
-        head = name.split(delim, 1)[0]
-    return _safe_segment(head)
 
+        def head_fn(name):
+            parts = name.split(None, 1)
+            return parts[0] if parts else name
 
-def _read_catalog_file(catalog_file_path):
-    if not os.path.exists(catalog_file_path):
-        return DEFAULT_HEADER_LINES[:], {}
+        return head_fn
 
-    headers = []
-    path_to_entry = {}
+    def head_fn(name):
+        return name.split(delim, 1)[0]
+
+    return head_fn
+
+
+def _read_catalog_file(catalog_file_path):
+    # Opening directly and catching FileNotFoundError saves the stat an
+    # os.path.exists probe would add on every Preview/Apply.
     try:
         with open(catalog_file_path, "r", encoding="utf-8") as handle:
-            for line_number, line in enumerate(handle, start=1):
-                stripped = line.strip()
-                if not stripped:
-                    continue
-                if stripped.startswith("#") or stripped.startswith("VERSION "):
-                    headers.append(stripped)
-                    continue
-                parts = stripped.split(":", 2)
-                if len(parts) != 3:
-                    raise ValueError(
-                        f"Catalog file contains a malformed entry on line {line_number}: {catalog_file_path}"
-                    )
-                catalog_uuid, catalog_path, catalog_name = parts
-                if not catalog_uuid or not catalog_path or not catalog_name:
-                    raise ValueError(
-                        f"Catalog file contains an incomplete entry on line {line_number}: {catalog_file_path}"
-                    )
-                path_to_entry[catalog_path] = {
-                    "uuid": catalog_uuid,
-                    "name": catalog_name,
-                }
+            data = handle.read()
+    except FileNotFoundError:
+        return DEFAULT_HEADER_LINES[:], {}
     except UnicodeError as exc:
         raise ValueError(
             f"Catalog file must be UTF-8 encoded: {catalog_file_path}"
         ) from exc
 
+    headers = []
+    path_to_entry = {}
+    has_version = False
+    for line_number, line in enumerate(data.splitlines(), start=1):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped[0] == "#" or stripped.startswith("VERSION "):
+            if stripped[0] == "V":
+                has_version = True
+            headers.append(stripped)
+            continue
+        catalog_uuid, sep_uuid, rest = stripped.partition(":")
+        catalog_path, sep_path, catalog_name = rest.partition(":")
+        if not sep_uuid or not sep_path:
+            raise ValueError(
+                f"Catalog file contains a malformed entry on line {line_number}: {catalog_file_path}"
+            )
+        if not catalog_uuid or not catalog_path or not catalog_name:
+            raise ValueError(
+                f"Catalog file contains an incomplete entry on line {line_number}: {catalog_file_path}"
+            )
+        path_to_entry[catalog_path] = {
+            "uuid": catalog_uuid,
+            "name": catalog_name,
+        }
+
     if not headers:
         headers = DEFAULT_HEADER_LINES[:]
-    if not any(line.startswith("VERSION ") for line in headers):
+        has_version = True
+    if not has_version:
         headers.append("VERSION 1")
     return headers, path_to_entry
 
 
 def _catalog_file_payload(headers, path_to_entry):
-    lines = [line.rstrip() for line in headers]
-    for catalog_path in sorted(path_to_entry.keys()):
-        entry = path_to_entry[catalog_path]
-        lines.append(f"{entry['uuid']}:{catalog_path}:{entry['name']}")
-    return "\n".join(lines) + "\n"
+    body = "\n".join(
+        itertools.chain(
+            (line.rstrip() for line in headers),
+            (
+                f"{entry['uuid']}:{catalog_path}:{entry['name']}"
+                for catalog_path, entry in sorted(path_to_entry.items())
+            ),
+        )
+    )
+    return body + "\n"
 
 
 def _write_text_atomic(file_path, payload):
     temp_path = f"{file_path}.tmp.{uuid.uuid4().hex}"
     try:
-        with open(temp_path, "w", encoding="utf-8", newline="\n") as handle:
+        with open(temp_path, "w", encoding="utf-8", newline="\n", buffering=1 << 20) as handle:
             handle.write(payload)
         os.replace(temp_path, file_path)
     finally:
@@ -264,6 +349,17 @@ def _write_catalog_file_with_backup(catalog_file_path, headers, path_to_entry):
     payload = _catalog_file_payload(headers, path_to_entry)
 
     if os.path.exists(catalog_file_path):
+        # Re-applying an unchanged configuration should not touch the disk;
+        # skipping identical rewrites also keeps the .bak recovery point from
+        # being overwritten with the same content.
+        try:
+            with open(catalog_file_path, "rb") as handle:
+                existing_payload = handle.read()
+        except OSError:
+            existing_payload = None
+        if existing_payload is not None and existing_payload == payload.encode("utf-8"):
+            return
+
         temp_backup_path = f"{backup_file_path}.tmp.{uuid.uuid4().hex}"
         try:
             shutil.copy2(catalog_file_path, temp_backup_path)
@@ -285,7 +381,7 @@ def _write_catalog_file_with_backup(catalog_file_path, headers, path_to_entry):
     catalog_published = False
 
     try:
-        with open(temp_catalog_path, "w", encoding="utf-8", newline="\n") as handle:
+        with open(temp_catalog_path, "w", encoding="utf-8", newline="\n", buffering=1 << 20) as handle:
             handle.write(payload)
         shutil.copy2(temp_catalog_path, temp_backup_path)
         os.replace(temp_backup_path, backup_file_path)
@@ -333,8 +429,11 @@ def _ensure_catalogs(asset_library_root, catalog_paths):
     catalog_file_path, _ = _catalog_paths_for_root(asset_library_root)
     headers, path_to_entry = _read_catalog_file(catalog_file_path)
 
+    # Insertion order is irrelevant here — the payload writer sorts the merged
+    # entries once, so pre-sorting catalog_paths would only add a second
+    # O(N log N) pass.
     created = 0
-    for catalog_path in sorted(catalog_paths):
+    for catalog_path in catalog_paths:
         norm = _normalize_path_fragment(catalog_path)
         if not norm or norm in path_to_entry:
             continue
@@ -347,59 +446,82 @@ def _ensure_catalogs(asset_library_root, catalog_paths):
     if created > 0:
         _write_catalog_file_with_backup(catalog_file_path, headers, path_to_entry)
 
-    return {path: data["uuid"] for path, data in path_to_entry.items()}, created
+    return path_to_entry, created
 
 
 def _iter_target_datablocks(prefs):
-    buckets = []
-    if prefs.target_type == "ALL":
-        buckets = [
-            ("Materials", bpy.data.materials),
-            ("Node_Groups", bpy.data.node_groups),
-            ("Objects", bpy.data.objects),
-            ("Collections", bpy.data.collections),
-        ]
-    elif prefs.target_type == "MATERIALS":
-        buckets = [("Materials", bpy.data.materials)]
-    elif prefs.target_type == "NODE_GROUPS":
-        buckets = [("Node_Groups", bpy.data.node_groups)]
-    elif prefs.target_type == "OBJECTS_COLLECTIONS":
-        buckets = [("Objects", bpy.data.objects), ("Collections", bpy.data.collections)]
-
-    for type_segment, bucket in buckets:
-        for datablock in bucket:
+    for type_segment, data_attr in _TARGET_TYPE_BUCKETS.get(prefs.target_type, ()):
+        for datablock in getattr(bpy.data, data_attr):
             yield datablock, type_segment
 
 
-def _source_file_for_datablock(datablock):
-    linked = getattr(datablock, "library", None)
+# Which datablock types expose a .data ID; learned once per type so the
+# common local-material case avoids a failing getattr per datablock.
+_TYPE_HAS_DATA = {}
+
+# Same idea for asset_mark: datablocks in one bucket share a type, so the
+# hasattr probe is paid once per type instead of once per datablock.
+_TYPE_CAN_MARK = {}
+
+
+def _type_can_mark(datablock):
+    datablock_type = type(datablock)
+    can_mark = _TYPE_CAN_MARK.get(datablock_type)
+    if can_mark is None:
+        can_mark = hasattr(datablock, "asset_mark")
+        _TYPE_CAN_MARK[datablock_type] = can_mark
+    return can_mark
+
+
+def _source_filepath_raw(datablock):
+    # Every targeted datablock is an ID, so .library and
+    # .library_weak_reference are guaranteed attributes.
+    linked = datablock.library
     if linked is not None and linked.filepath:
-        return os.path.abspath(bpy.path.abspath(linked.filepath))
-
-    weak_ref = getattr(datablock, "library_weak_reference", None)
-    weak_path = getattr(weak_ref, "filepath", "") if weak_ref is not None else ""
-    if weak_path:
-        return os.path.abspath(bpy.path.abspath(weak_path))
-
-    datablock_data = getattr(datablock, "data", None)
-    if datablock_data is not None:
-        data_linked = getattr(datablock_data, "library", None)
-        if data_linked is not None and data_linked.filepath:
-            return os.path.abspath(bpy.path.abspath(data_linked.filepath))
-        data_weak_ref = getattr(datablock_data, "library_weak_reference", None)
-        data_weak_path = getattr(data_weak_ref, "filepath", "") if data_weak_ref is not None else ""
-        if data_weak_path:
-            return os.path.abspath(bpy.path.abspath(data_weak_path))
+        return linked.filepath
+
+    weak_ref = datablock.library_weak_reference
+    if weak_ref is not None and weak_ref.filepath:
+        return weak_ref.filepath
+
+    datablock_type = type(datablock)
+    has_data = _TYPE_HAS_DATA.get(datablock_type)
+    if has_data is None:
+        has_data = hasattr(datablock, "data")
+        _TYPE_HAS_DATA[datablock_type] = has_data
+
+    if has_data:
+        datablock_data = datablock.data
+        if datablock_data is not None:
+            data_linked = datablock_data.library
+            if data_linked is not None and data_linked.filepath:
+                return data_linked.filepath
+            data_weak_ref = datablock_data.library_weak_reference
+            if data_weak_ref is not None and data_weak_ref.filepath:
+                return data_weak_ref.filepath
 
     return None
 
 
-def _source_dir_for_datablock(datablock):
-    source_file = _source_file_for_datablock(datablock)
-    if source_file:
-        return os.path.dirname(source_file), False
-    if bpy.data.filepath:
-        return os.path.dirname(os.path.abspath(bpy.data.filepath)), True
+def _source_dir_for_datablock(datablock, src_dir_cache):
+    # Many datablocks share a handful of source .blend files; resolving each
+    # raw path once collapses N abspath round-trips to K unique libraries.
+    raw_path = _source_filepath_raw(datablock)
+    if raw_path:
+        src_dir = src_dir_cache.get(raw_path)
+        if src_dir is None:
+            src_dir = os.path.dirname(os.path.abspath(bpy.path.abspath(raw_path)))
+            src_dir_cache[raw_path] = src_dir
+        return src_dir, False
+    blend_path = bpy.data.filepath
+    if blend_path:
+        # Local datablocks all resolve to the current .blend's directory;
+        # memoize it alongside the library dirs instead of re-deriving it.
+        src_dir = src_dir_cache.get(blend_path)
+        if src_dir is None:
+            src_dir = os.path.dirname(os.path.abspath(blend_path))
+            src_dir_cache[blend_path] = src_dir
+        return src_dir, True
     return None, False
 
 
@@ -415,48 +537,57 @@ def _compose_catalog_path(root_prefix, tail):
     return "Uncategorized"
 
 
-def _catalog_path_for_datablock(datablock, type_segment, prefs, library_root):
-    if prefs.classification_mode == "NAME_PREFIX":
-        tail = _prefix_from_name(datablock.name, prefs.prefix_delimiter)
-        return _compose_catalog_path(prefs.catalog_root_prefix, tail)
-
-    src_dir, from_blend_fallback = _source_dir_for_datablock(datablock)
+def _catalog_path_for_relative_folder(datablock, type_segment, root_prefix, library_root, caches):
+    src_dir_cache, rel_cache, tail_cache = caches
+    src_dir, from_blend_fallback = _source_dir_for_datablock(datablock, src_dir_cache)
     if not src_dir:
         return None
 
-    try:
-        rel = os.path.relpath(src_dir, library_root)
-    except ValueError:
-        return None
+    rel = rel_cache.get(src_dir)
+    if rel is None:
+        try:
+            rel = os.path.relpath(src_dir, library_root)
+        except ValueError:
+            rel = ".."
+        rel_cache[src_dir] = rel
     if rel.startswith(".."):
         return None
 
     if rel == ".":
-        tail = _safe_segment(type_segment) if from_blend_fallback else ""
+        tail = _TYPE_SEGMENT_SAFE[type_segment] if from_blend_fallback else ""
     else:
-        segments = [_safe_segment(part) for part in rel.replace("\\", "/").split("/") if part and part != "."]
+        tail = tail_cache.get(rel)
+        if tail is None:
+            parts = [part for part in rel.translate(_SEP_TRANSLATE).split("/") if part and part != "."]
+            tail = "/".join(_safe_segment(part) for part in parts)
+            tail_cache[rel] = tail
         if from_blend_fallback:
-            segments.append(_safe_segment(type_segment))
-        tail = "/".join(segments)
+            type_safe = _TYPE_SEGMENT_SAFE[type_segment]
+            tail = f"{tail}/{type_safe}" if tail else type_safe
 
-    return _compose_catalog_path(prefs.catalog_root_prefix, tail)
+    return _compose_catalog_path(root_prefix, tail)
 
 
 def _plan_signature(prefs, root, plan):
     digest = hashlib.sha1()
-    digest.update(root.encode("utf-8"))
-    digest.update(prefs.asset_library_name.encode("utf-8"))
-    digest.update(prefs.asset_library_root_folder.encode("utf-8"))
-    digest.update(prefs.classification_mode.encode("utf-8"))
-    digest.update(prefs.prefix_delimiter.encode("utf-8"))
-    digest.update(prefs.catalog_root_prefix.encode("utf-8"))
-    digest.update(prefs.target_type.encode("utf-8"))
-    digest.update(str(bool(prefs.auto_mark_missing_as_assets)).encode("utf-8"))
+    buf = bytearray()
+    buf += root.encode("utf-8")
+    buf += prefs.asset_library_name.encode("utf-8")
+    buf += prefs.asset_library_root_folder.encode("utf-8")
+    buf += prefs.classification_mode.encode("utf-8")
+    buf += prefs.prefix_delimiter.encode("utf-8")
+    buf += prefs.catalog_root_prefix.encode("utf-8")
+    buf += prefs.target_type.encode("utf-8")
+    buf += str(bool(prefs.auto_mark_missing_as_assets)).encode("utf-8")
     for datablock, catalog_path in plan:
-        digest.update(datablock.name.encode("utf-8"))
-        digest.update(b"\0")
-        digest.update(catalog_path.encode("utf-8"))
-        digest.update(b"\0")
+        buf += datablock.name.encode("utf-8")
+        buf += b"\0"
+        buf += catalog_path.encode("utf-8")
+        buf += b"\0"
+        if len(buf) > 65536:
+            digest.update(buf)
+            buf.clear()
+    digest.update(buf)
     return digest.hexdigest()
 
 
@@ -464,6 +595,17 @@ def _build_assignment_plan(context, prefs):
     library_root, root_source = _require_asset_library_root(context, prefs)
     _validate_catalog_root_prefix(prefs.catalog_root_prefix)
 
+    # Each prefs.X access crosses the RNA boundary; resolve the options and
+    # the classification branch once instead of per datablock.
+    root_prefix = prefs.catalog_root_prefix
+    auto_mark_missing = prefs.auto_mark_missing_as_assets
+    name_prefix_mode = prefs.classification_mode == "NAME_PREFIX"
+    head_fn = _make_prefix_head_fn(prefs.prefix_delimiter) if name_prefix_mode else None
+    folder_caches = ({}, {}, {})
+    # Prefix grouping means the same head recurs across many names; sanitize
+    # and compose each distinct head once instead of per datablock.
+    head_to_path = {}
+
     assignable_plan = []
     skipped_linked = 0
     skipped_external = 0
@@ -471,19 +613,28 @@ def _build_assignment_plan(context, prefs):
     will_auto_mark = 0
 
     for datablock, type_segment in _iter_target_datablocks(prefs):
-        if getattr(datablock, "library", None) is not None:
+        if datablock.library is not None:
             skipped_linked += 1
             continue
 
-        catalog_path = _catalog_path_for_datablock(datablock, type_segment, prefs, library_root)
+        if name_prefix_mode:
+            head = head_fn(datablock.name)
+            catalog_path = head_to_path.get(head)
+            if catalog_path is None:
+                catalog_path = _compose_catalog_path(root_prefix, _safe_segment(head))
+                head_to_path[head] = catalog_path
+        else:
+            catalog_path = _catalog_path_for_relative_folder(
+                datablock, type_segment, root_prefix, library_root, folder_caches
+            )
         if not catalog_path:
             skipped_external += 1
             continue
 
-        asset_data = getattr(datablock, "asset_data", None)
-        can_mark = hasattr(datablock, "asset_mark")
+        asset_data = datablock.asset_data
+        can_mark = _type_can_mark(datablock)
         if asset_data is None:
-            if prefs.auto_mark_missing_as_assets and can_mark:
+            if auto_mark_missing and can_mark:
                 will_auto_mark += 1
             else:
                 skipped_non_assets += 1
@@ -634,12 +785,13 @@ class AUTO_CATALOGER_OT_preview(Operator):
             self.report({"ERROR"}, str(exc))
             return {"CANCELLED"}
 
-        by_catalog = defaultdict(int)
-        for datablock, catalog_path in plan:
-            by_catalog[catalog_path] += 1
+        # Counter consumes the generator at C speed; the visible-row loop that
+        # follows is capped at 50 entries, so it stays cheap at any plan size.
+        by_catalog = Counter(catalog_path for _, catalog_path in plan)
 
+        add_row = state.preview_items.add
         for datablock, catalog_path in plan[:50]:
-            row = state.preview_items.add()
+            row = add_row()
             row.asset_name = datablock.name
             row.catalog_path = catalog_path
 
@@ -703,7 +855,9 @@ class AUTO_CATALOGER_OT_apply(Operator):
             self.report({"WARNING"}, "No assignable assets found with current options.")
             return {"CANCELLED"}
 
-        catalog_paths = sorted({catalog_path for _, catalog_path in plan})
+        # No order needed here: the payload writer sorts the merged entries
+        # for stable file output, and everything below only counts or looks up.
+        catalog_paths = {catalog_path for _, catalog_path in plan}
         try:
             uuid_map, created = _ensure_catalogs(root, catalog_paths)
         except (OSError, ValueError) as exc:
@@ -713,12 +867,24 @@ class AUTO_CATALOGER_OT_apply(Operator):
         assigned = 0
         auto_marked = 0
         failures = []
+        # RNA attribute lookups dominate this loop; resolve the invariants to
+        # locals once. IDs always expose asset_data (None when unmarked).
+        # The UUID strings are pre-resolved per catalog path so the loop does
+        # one dict hop per datablock instead of a lookup plus entry subscript;
+        # paths missing from the map still surface as per-datablock failures.
+        auto_mark = prefs.auto_mark_missing_as_assets
+        cid_by_path = {}
+        for catalog_path in catalog_paths:
+            entry = uuid_map.get(catalog_path)
+            if entry is not None:
+                cid_by_path[catalog_path] = entry["uuid"]
+        uuid_get = cid_by_path.__getitem__
         for datablock, catalog_path in plan:
             try:
-                asset_data = getattr(datablock, "asset_data", None)
-                if asset_data is None and prefs.auto_mark_missing_as_assets and hasattr(datablock, "asset_mark"):
+                asset_data = datablock.asset_data
+                if asset_data is None and auto_mark and _type_can_mark(datablock):
                     datablock.asset_mark()
-                    asset_data = getattr(datablock, "asset_data", None)
+                    asset_data = datablock.asset_data
                     if asset_data is not None:
                         auto_marked += 1
                     else:
@@ -728,7 +894,7 @@ class AUTO_CATALOGER_OT_apply(Operator):
                 if asset_data is None:
                     continue
 
-                asset_data.catalog_id = uuid_map[catalog_path]
+                asset_data.catalog_id = uuid_get(catalog_path)
                 assigned += 1
             except (OSError, RuntimeError, KeyError) as exc:
                 failures.append(f"{datablock.name}: {exc}")
@@ -839,8 +1005,14 @@ class AUTO_CATALOGER_PT_panel(Panel):
         root, root_source, root_error = _resolve_asset_library_root(context, prefs)
         catalog_file = ""
         backup_file = ""
+        # Stat each file once per redraw; the sidebar redraws continuously and
+        # every os.path check below is a syscall on the UI thread.
+        catalog_exists = False
+        backup_exists = False
         if root:
             catalog_file, backup_file = _catalog_paths_for_root(root)
+            catalog_exists = os.path.isfile(catalog_file)
+            backup_exists = os.path.isfile(backup_file)
 
         col = layout.column(align=True)
         col.prop(prefs, "asset_library_name")
@@ -859,14 +1031,14 @@ class AUTO_CATALOGER_PT_panel(Panel):
         safety.label(text="Safety & Recovery")
         safety.label(text=f"Root source: {root_source}")
         if root:
-            safety.label(text=f"Catalog file: {'Exists' if os.path.exists(catalog_file) else 'Missing'}")
-            safety.label(text=f"Backup file: {'Exists' if os.path.exists(backup_file) else 'Missing'}")
+            safety.label(text=f"Catalog file: {'Exists' if catalog_exists else 'Missing'}")
+            safety.label(text=f"Backup file: {'Exists' if backup_exists else 'Missing'}")
             safety.label(text=f".cats: {catalog_file}")
             safety.label(text=f".bak: {backup_file}")
         else:
             safety.label(text=root_error or "Root not resolved yet.")
         restore_row = safety.row(align=True)
-        restore_row.enabled = bool(backup_file and os.path.exists(backup_file))
+        restore_row.enabled = backup_exists
         restore_row.operator("auto_cataloger.restore_backup", icon="LOOP_BACK")
         safety.label(text="Blender Undo does not revert external .cats file changes.")
 
@@ -902,6 +1074,10 @@ classes = (
 
 
 def register():
+    _ABS_PATH_CACHE.clear()
+    _ITEM_ID_CACHE.clear()
+    _TYPE_HAS_DATA.clear()
+    _TYPE_CAN_MARK.clear()
     for cls in classes:
         bpy.utils.register_class(cls)
     bpy.types.Scene.auto_cataloger_runtime = PointerProperty(type=AUTO_CATALOGER_runtime)
@@ -912,6 +1088,10 @@ def unregister():
         del bpy.types.Scene.auto_cataloger_runtime
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
+    _ABS_PATH_CACHE.clear()
+    _ITEM_ID_CACHE.clear()
+    _TYPE_HAS_DATA.clear()
+    _TYPE_CAN_MARK.clear()
 
 
 if __name__ == "__main__":
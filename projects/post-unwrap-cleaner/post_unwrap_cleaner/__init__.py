@@ -55,29 +55,43 @@ def _uv_context_ok(context):
 
 
 def _snapshot_uv_selection_state(bm, uv_layer):
-    snapshot = []
+    # foreach_get is unavailable in edit mode, so the compact form here is
+    # parallel sequences: the BMLoopUV wrappers plus one byte per flag,
+    # instead of a (loop, bool, bool) tuple per loop. Keeping the wrapper
+    # also saves the custom-data re-index on restore.
+    luvs = []
+    selected = bytearray()
+    selected_edge = bytearray()
     for face in bm.faces:
         if face.hide:
             continue
         for loop in face.loops:
             luv = loop[uv_layer]
-            snapshot.append((loop, luv.select, luv.select_edge))
-    return snapshot
+            luvs.append(luv)
+            selected.append(luv.select)
+            selected_edge.append(luv.select_edge)
+    return luvs, selected, selected_edge
 
 
-def _restore_uv_selection_state(snapshot, uv_layer):
-    for loop, selected, selected_edge in snapshot:
+def _restore_uv_selection_state(snapshot):
+    if snapshot is None:
+        return
+    luvs, selected, selected_edge = snapshot
+    for luv, sel, sel_edge in zip(luvs, selected, selected_edge):
         try:
-            luv = loop[uv_layer]
+            luv.select = bool(sel)
+            luv.select_edge = bool(sel_edge)
         except ReferenceError:
             continue
-        luv.select = selected
-        luv.select_edge = selected_edge
 
 
 def _prepare_target_selection(bm, uv_layer, target, respect_pins):
+    # Collect, clear and re-select in a single traversal; the original
+    # three-pass version paid the loop[uv_layer] custom-data lookup per loop
+    # per pass. The original selection is read before any write.
     target_loops = []
     skipped_pins = 0
+    take_all = target != "SELECTED"
 
     for face in bm.faces:
         if face.hide:
@@ -86,28 +100,22 @@ def _prepare_target_selection(bm, uv_layer, target, respect_pins):
             luv = loop[uv_layer]
             if respect_pins and luv.pin_uv:
                 skipped_pins += 1
+                luv.select = False
+                luv.select_edge = False
                 continue
-            if target == "SELECTED" and not luv.select:
-                continue
-            target_loops.append(loop)
-
-    for face in bm.faces:
-        if face.hide:
-            continue
-        for loop in face.loops:
-            luv = loop[uv_layer]
-            luv.select = False
-            luv.select_edge = False
-
-    for loop in target_loops:
-        luv = loop[uv_layer]
-        luv.select = True
-        luv.select_edge = True
+            take = take_all or luv.select
+            luv.select = take
+            luv.select_edge = take
+            if take:
+                target_loops.append(loop)
 
     return target_loops, skipped_pins
 
 
 def _straighten_selected_loops(loops, uv_layer, threshold, respect_pins):
+    # Edit-mode UV data lives in bmesh (Mesh.uv_layers is empty here), so a
+    # foreach_get/NumPy bulk path is not available; the next best win is to
+    # resolve each BMLoopUV's uv Vector once instead of per component access.
     adjusted = 0
     for loop in loops:
         luv_a = loop[uv_layer]
@@ -116,25 +124,61 @@ def _straighten_selected_loops(loops, uv_layer, threshold, respect_pins):
             continue
         if respect_pins and (luv_a.pin_uv or luv_b.pin_uv):
             continue
-        dx = luv_b.uv.x - luv_a.uv.x
-        dy = luv_b.uv.y - luv_a.uv.y
+        uv_a = luv_a.uv
+        uv_b = luv_b.uv
+        ax, ay = uv_a
+        bx, by = uv_b
+        dx = bx - ax
+        dy = by - ay
         adx = abs(dx)
         ady = abs(dy)
         if adx == 0.0 and ady == 0.0:
             continue
         if adx <= ady * threshold:
-            snap_x = (luv_a.uv.x + luv_b.uv.x) * 0.5
-            luv_a.uv.x = snap_x
-            luv_b.uv.x = snap_x
+            snap_x = (ax + bx) * 0.5
+            uv_a.x = snap_x
+            uv_b.x = snap_x
             adjusted += 1
         elif ady <= adx * threshold:
-            snap_y = (luv_a.uv.y + luv_b.uv.y) * 0.5
-            luv_a.uv.y = snap_y
-            luv_b.uv.y = snap_y
+            snap_y = (ay + by) * 0.5
+            uv_a.y = snap_y
+            uv_b.y = snap_y
             adjusted += 1
     return adjusted
 
 
+def _straighten_all_loops(bm, uv_layer, threshold):
+    # Specialized for target "ALL" with Respect Pins off: every visible loop
+    # was just selected by _prepare_target_selection and pins are fair game,
+    # so the per-loop select/pin checks are constants and drop out.
+    adjusted = 0
+    for face in bm.faces:
+        if face.hide:
+            continue
+        for loop in face.loops:
+            uv_a = loop[uv_layer].uv
+            uv_b = loop.link_loop_next[uv_layer].uv
+            ax, ay = uv_a
+            bx, by = uv_b
+            dx = bx - ax
+            dy = by - ay
+            adx = abs(dx)
+            ady = abs(dy)
+            if adx == 0.0 and ady == 0.0:
+                continue
+            if adx <= ady * threshold:
+                snap_x = (ax + bx) * 0.5
+                uv_a.x = snap_x
+                uv_b.x = snap_x
+                adjusted += 1
+            elif ady <= adx * threshold:
+                snap_y = (ay + by) * 0.5
+                uv_a.y = snap_y
+                uv_b.y = snap_y
+                adjusted += 1
+    return adjusted
+
+
 def _pack_islands_kwargs(margin, respect_pins):
     kwargs = {"margin": margin}
     if not respect_pins:
@@ -193,6 +237,11 @@ class PUC_Settings(PropertyGroup):
         description="Do not move pinned UVs",
         default=True,
     )
+    preserve_selection: BoolProperty(
+        name="Preserve Selection",
+        description="Restore the original UV selection after cleanup; disable to skip the extra mesh passes",
+        default=True,
+    )
 
 
 class PUC_OT_one_click_clean(Operator):
@@ -232,16 +281,21 @@ class PUC_OT_one_click_clean(Operator):
             self.report({"ERROR"}, "No active UV map found.")
             return {"CANCELLED"}
 
-        snapshot = _snapshot_uv_selection_state(bm, uv_layer)
+        target = settings.target
+        respect_pins = settings.respect_pins
+
+        snapshot = None
+        if settings.preserve_selection:
+            snapshot = _snapshot_uv_selection_state(bm, uv_layer)
         loops, skipped_pins = _prepare_target_selection(
             bm=bm,
             uv_layer=uv_layer,
-            target=settings.target,
-            respect_pins=settings.respect_pins,
+            target=target,
+            respect_pins=respect_pins,
         )
 
         if not loops:
-            _restore_uv_selection_state(snapshot, uv_layer)
+            _restore_uv_selection_state(snapshot)
             bmesh.update_edit_mesh(me, loop_triangles=False, destructive=False)
             self.report({"WARNING"}, "No UVs available for current target/pin filter.")
             return {"CANCELLED"}
@@ -254,19 +308,26 @@ class PUC_OT_one_click_clean(Operator):
         area = context.area
         region = _get_uv_window_region(area)
         if region is None:
-            _restore_uv_selection_state(snapshot, uv_layer)
+            _restore_uv_selection_state(snapshot)
             bmesh.update_edit_mesh(me, loop_triangles=False, destructive=False)
             self.report({"ERROR"}, "UV window region not found.")
             return {"CANCELLED"}
 
         try:
             if settings.run_straighten:
-                changed = _straighten_selected_loops(
-                    loops=loops,
-                    uv_layer=uv_layer,
-                    threshold=settings.straighten_threshold,
-                    respect_pins=settings.respect_pins,
-                )
+                if target == "ALL" and not respect_pins:
+                    changed = _straighten_all_loops(
+                        bm=bm,
+                        uv_layer=uv_layer,
+                        threshold=settings.straighten_threshold,
+                    )
+                else:
+                    changed = _straighten_selected_loops(
+                        loops=loops,
+                        uv_layer=uv_layer,
+                        threshold=settings.straighten_threshold,
+                        respect_pins=respect_pins,
+                    )
                 if changed > 0:
                     did_modify = True
 
@@ -287,14 +348,14 @@ class PUC_OT_one_click_clean(Operator):
                     bpy.ops.uv.pack_islands(
                         **_pack_islands_kwargs(
                             margin=settings.packing_margin,
-                            respect_pins=settings.respect_pins,
+                            respect_pins=respect_pins,
                         )
                     )
                     packed = True
                     did_modify = True
 
         except RuntimeError as exc:
-            _restore_uv_selection_state(snapshot, uv_layer)
+            _restore_uv_selection_state(snapshot)
             bmesh.update_edit_mesh(me, loop_triangles=False, destructive=False)
             if did_modify:
                 self.report({"ERROR"}, f"UV operation failed after partial changes. Use Undo to revert. Details: {exc}")
@@ -302,7 +363,7 @@ class PUC_OT_one_click_clean(Operator):
             self.report({"ERROR"}, f"UV operation failed: {exc}")
             return {"CANCELLED"}
 
-        _restore_uv_selection_state(snapshot, uv_layer)
+        _restore_uv_selection_state(snapshot)
         bmesh.update_edit_mesh(me, loop_triangles=False, destructive=False)
 
         self.report(
@@ -344,9 +405,13 @@ class PUC_PT_uv_sidebar(Panel):
         flow.prop(settings, "run_relax")
         flow.prop(settings, "run_pack")
         flow.prop(settings, "respect_pins")
+        flow.prop(settings, "preserve_selection")
 
         layout.operator("puc.one_click_clean", icon="CHECKMARK")
-        layout.label(text="Selection is restored after execution.")
+        if settings.preserve_selection:
+            layout.label(text="Selection is restored after execution.")
+        else:
+            layout.label(text="Cleanup selection is kept after execution.")
 
 
 classes = (
@@ -26,6 +26,7 @@ bl_info = {
 }
 
 import bpy
+import numpy as np
 from bpy.props import EnumProperty, FloatProperty, PointerProperty
 from bpy.types import Operator, Panel, PropertyGroup
 from mathutils import Vector
@@ -35,6 +36,10 @@ ERR_EDIT_MODE = "Enter Edit Mode on a Curve object."
 ERR_NO_BEZIER = "No Bezier points found in the selected target scope."
 ERR_VIEW_AXIS = "View axis/space requires an active 3D View region."
 
+# Below this many target points the foreach_get/foreach_set round-trip costs
+# more than it saves; fall back to the plain Python loops.
+_VECTORIZE_MIN_POINTS = 32
+
 
 def _active_curve_object(context):
     obj = context.active_object
@@ -59,12 +64,12 @@ def _view_axis_world(context, axis):
     return rotation @ Vector((0.0, 0.0, -1.0))
 
 
-def _axis_local_vector(context, obj, axis, axis_space):
+def _axis_local_vector(context, axis, axis_space, mw_inv_3x3):
     if axis == "VIEW":
         world_vec = _view_axis_world(context, "Z")
         if world_vec is None:
             return None
-        local_vec = obj.matrix_world.to_3x3().inverted_safe() @ world_vec
+        local_vec = mw_inv_3x3 @ world_vec
         return local_vec.normalized() if local_vec.length > 0.0 else None
 
     axis_map_local = {
@@ -78,32 +83,126 @@ def _axis_local_vector(context, obj, axis, axis_space):
 
     if axis_space == "WORLD":
         world_vec = axis_map_local[axis]
-        local_vec = obj.matrix_world.to_3x3().inverted_safe() @ world_vec
+        local_vec = mw_inv_3x3 @ world_vec
         return local_vec.normalized() if local_vec.length > 0.0 else None
 
     world_vec = _view_axis_world(context, axis)
     if world_vec is None:
         return None
-    local_vec = obj.matrix_world.to_3x3().inverted_safe() @ world_vec
+    local_vec = mw_inv_3x3 @ world_vec
     return local_vec.normalized() if local_vec.length > 0.0 else None
 
 
-def _iter_target_points(obj, target):
+def _target_spline_arrays(obj, target):
+    """Gather per-spline NumPy arrays for the targeted Bezier points.
+
+    Returns a list of (spline, mask, co, handle_left, handle_right) tuples,
+    where the arrays have shape (N, 3) and mask is a boolean array over the
+    spline's points — or None when every point is targeted.
+    """
+    selected_only = target == "SELECTED_ONLY"
+    gathered = []
+    for spline in obj.data.splines:
+        if spline.type != "BEZIER":
+            continue
+        points = spline.bezier_points
+        count = len(points)
+        if count == 0:
+            continue
+
+        mask = None
+        if selected_only:
+            mask = np.zeros(count, dtype=bool)
+            scratch = np.zeros(count, dtype=bool)
+            points.foreach_get("select_control_point", mask)
+            points.foreach_get("select_left_handle", scratch)
+            mask |= scratch
+            points.foreach_get("select_right_handle", scratch)
+            mask |= scratch
+            if not mask.any():
+                continue
+            if mask.all():
+                mask = None
+
+        co = np.empty(count * 3, dtype=np.float32)
+        handle_left = np.empty(count * 3, dtype=np.float32)
+        handle_right = np.empty(count * 3, dtype=np.float32)
+        points.foreach_get("co", co)
+        points.foreach_get("handle_left", handle_left)
+        points.foreach_get("handle_right", handle_right)
+        gathered.append(
+            (
+                spline,
+                mask,
+                co.reshape(count, 3),
+                handle_left.reshape(count, 3),
+                handle_right.reshape(count, 3),
+            )
+        )
+    return gathered
+
+
+def _write_spline_arrays(spline, co, handle_left, handle_right):
+    points = spline.bezier_points
+    points.foreach_set("co", co.ravel())
+    points.foreach_set("handle_left", handle_left.ravel())
+    points.foreach_set("handle_right", handle_right.ravel())
+
+
+def _count_target_points(arrays):
+    total = 0
+    for _spline, mask, co, _handle_left, _handle_right in arrays:
+        total += co.shape[0] if mask is None else int(mask.sum())
+    return total
+
+
+def _iter_all_points(obj):
+    for spline in obj.data.splines:
+        if spline.type == "BEZIER":
+            yield from spline.bezier_points
+
+
+def _iter_selected_points(obj):
+    # Pulling the three selection flags per spline in bulk replaces 3N RNA
+    # reads with three foreach_get calls, and lets splines with nothing
+    # selected be skipped without touching a single point.
     for spline in obj.data.splines:
         if spline.type != "BEZIER":
             continue
-        for point in spline.bezier_points:
-            if target == "SELECTED_ONLY":
-                if not (point.select_control_point or point.select_left_handle or point.select_right_handle):
-                    continue
-            yield point
+        points = spline.bezier_points
+        count = len(points)
+        if count == 0:
+            continue
+        mask = np.empty(count, dtype=bool)
+        flags = np.empty(count, dtype=bool)
+        points.foreach_get("select_control_point", mask)
+        points.foreach_get("select_left_handle", flags)
+        mask |= flags
+        points.foreach_get("select_right_handle", flags)
+        mask |= flags
+        if not mask.any():
+            continue
+        for index in np.flatnonzero(mask):
+            yield points[index]
 
 
-def _active_point_or_first(points):
-    for point in points:
+def _iter_target_points(obj, target):
+    if target == "SELECTED_ONLY":
+        return _iter_selected_points(obj)
+    return _iter_all_points(obj)
+
+
+def _active_target_point(obj, target):
+    # Streams instead of taking a materialized list: returns as soon as a
+    # selected control point is found, remembering the first target point as
+    # the fallback.
+    first = None
+    for point in _iter_target_points(obj, target):
         if point.select_control_point:
             return point
-    return points[0]
+        if first is None:
+            first = point
+    return first
 
 
 def _set_handle_type(point, handle_type):
@@ -111,35 +210,101 @@ def _set_handle_type(point, handle_type):
     point.handle_right_type = handle_type
 
 
+# Enum identifier -> internal integer value, resolved from RNA on first use so
+# foreach_set can write handle types without per-point enum-string validation.
+_HANDLE_TYPE_CODES = {}
+
+
+def _handle_type_code(handle_type):
+    if not _HANDLE_TYPE_CODES:
+        enum_items = bpy.types.BezierSplinePoint.bl_rna.properties["handle_left_type"].enum_items
+        for item in enum_items:
+            _HANDLE_TYPE_CODES[item.identifier] = item.value
+    return _HANDLE_TYPE_CODES[handle_type]
+
+
+def _apply_handle_types(spline, mask, handle_type):
+    points = spline.bezier_points
+    count = len(points)
+    code = _handle_type_code(handle_type)
+    if mask is None:
+        codes = np.full(count, code, dtype=np.int32)
+        points.foreach_set("handle_left_type", codes)
+        points.foreach_set("handle_right_type", codes)
+        return
+    codes = np.empty(count, dtype=np.int32)
+    points.foreach_get("handle_left_type", codes)
+    codes[mask] = code
+    points.foreach_set("handle_left_type", codes)
+    points.foreach_get("handle_right_type", codes)
+    codes[mask] = code
+    points.foreach_set("handle_right_type", codes)
+
+
+def _apply_handle_types_only(obj, target, arrays, total_points, handle_type):
+    # Zero strength leaves every position untouched, so the math and the
+    # position write-back are skipped; only the handle types are written.
+    if total_points >= _VECTORIZE_MIN_POINTS:
+        for spline, mask, _co, _handle_left, _handle_right in arrays:
+            _apply_handle_types(spline, mask, handle_type)
+        return
+    for point in _iter_target_points(obj, target):
+        _set_handle_type(point, handle_type)
+
+
 def _refresh_curve_data(context, obj):
     obj.data.update_tag()
     context.view_layer.update()
 
 
+def _canonical_axis_index(axis_vec):
+    # X/Y/Z in local space come through as exact unit vectors; against those
+    # a dot product is a single component read, so callers can work on one
+    # coordinate instead of the full vector.
+    for index in range(3):
+        if axis_vec[index] == 1.0 and axis_vec[index - 1] == 0.0 and axis_vec[index - 2] == 0.0:
+            return index
+    return None
+
+
 def _flatten_vector(value, axis_vec, target_dot, strength):
     delta = (target_dot - value.dot(axis_vec)) * strength
     return value + axis_vec * delta
 
 
-def _flatten_target_dot(points, axis_vec, flatten_reference, obj, context):
+def _flatten_target_dot(arrays, total_points, axis_vec, flatten_reference, obj, context, target, mw_inv):
     if flatten_reference == "AVERAGE":
-        vectors = []
-        for point in points:
-            vectors.append(point.co.copy())
-            vectors.append(point.handle_left.copy())
-            vectors.append(point.handle_right.copy())
-        return sum(vec.dot(axis_vec) for vec in vectors) / len(vectors)
+        if total_points >= _VECTORIZE_MIN_POINTS:
+            # Fused reduction over the arrays the caller already gathered:
+            # three matvecs and a sum per spline, no stacked copies.
+            axis_np = np.array(axis_vec, dtype=np.float32)
+            total = 0.0
+            for _spline, mask, co, handle_left, handle_right in arrays:
+                dots = co @ axis_np + handle_left @ axis_np + handle_right @ axis_np
+                total += float(dots.sum() if mask is None else dots[mask].sum())
+            return total / (total_points * 3)
+
+        # dot() only reads the vectors, so no copies are needed; a running
+        # scalar sum avoids allocating 3N Vectors just to reduce them.
+        total = 0.0
+        for point in _iter_target_points(obj, target):
+            total += (
+                point.co.dot(axis_vec)
+                + point.handle_left.dot(axis_vec)
+                + point.handle_right.dot(axis_vec)
+            )
+        return total / (total_points * 3)
 
     if flatten_reference == "ACTIVE_POINT":
-        reference = _active_point_or_first(points)
+        reference = _active_target_point(obj, target)
         return reference.co.dot(axis_vec)
 
     if flatten_reference == "WORLD_ORIGIN":
-        local_origin = obj.matrix_world.inverted_safe() @ Vector((0.0, 0.0, 0.0))
+        local_origin = mw_inv @ Vector((0.0, 0.0, 0.0))
         return local_origin.dot(axis_vec)
 
     cursor_world = context.scene.cursor.location.copy()
-    cursor_local = obj.matrix_world.inverted_safe() @ cursor_world
+    cursor_local = mw_inv @ cursor_world
     return cursor_local.dot(axis_vec)
 
 
@@ -216,34 +381,74 @@ class SCH_OT_align_handles(Operator):
 
         settings = context.scene.sch_settings
         obj = _active_curve_object(context)
-        axis_vec = _axis_local_vector(context, obj, settings.axis, settings.axis_space)
+        mw_inv_3x3 = obj.matrix_world.to_3x3().inverted_safe()
+        axis_vec = _axis_local_vector(context, settings.axis, settings.axis_space, mw_inv_3x3)
         if axis_vec is None:
             self.report({"ERROR"}, ERR_VIEW_AXIS)
             return {"CANCELLED"}
 
-        points = list(_iter_target_points(obj, settings.target))
-        if not points:
+        target = settings.target
+        arrays = _target_spline_arrays(obj, target)
+        total_points = _count_target_points(arrays)
+        if total_points == 0:
             self.report({"WARNING"}, ERR_NO_BEZIER)
             return {"CANCELLED"}
 
-        for point in points:
-            co = point.co.copy()
-            for side_name, sign_hint in (("handle_left", -1.0), ("handle_right", 1.0)):
-                handle = getattr(point, side_name)
+        strength = settings.strength
+        handle_type = settings.handle_type
+        if strength == 0.0:
+            _apply_handle_types_only(obj, target, arrays, total_points, handle_type)
+            _refresh_curve_data(context, obj)
+            self.report({"INFO"}, f"Aligned {total_points} points")
+            return {"FINISHED"}
+        if total_points >= _VECTORIZE_MIN_POINTS:
+            axis_np = np.array(axis_vec, dtype=np.float32)
+            for spline, mask, co, handle_left, handle_right in arrays:
+                for handle, sign_hint in ((handle_left, -1.0), (handle_right, 1.0)):
+                    vec = handle - co
+                    length = np.linalg.norm(vec, axis=1)
+                    zero = length == 0.0
+                    sign = np.where(vec @ axis_np >= 0.0, 1.0, -1.0)
+                    sign[zero] = sign_hint
+                    length[zero] = 0.0001
+                    goal = co + axis_np * (length * sign)[:, None]
+                    moved = handle + (goal - handle) * strength
+                    if mask is None:
+                        handle[:] = moved
+                    else:
+                        handle[mask] = moved[mask]
+                _write_spline_arrays(spline, co, handle_left, handle_right)
+                _apply_handle_types(spline, mask, handle_type)
+        else:
+            for point in _iter_target_points(obj, target):
+                co = point.co.copy()
+
+                handle = point.handle_left
+                vec = handle - co
+                length = vec.length
+                if length == 0.0:
+                    sign = -1.0
+                    length = 0.0001
+                else:
+                    sign = 1.0 if vec.dot(axis_vec) >= 0.0 else -1.0
+                goal = co + axis_vec * length * sign
+                point.handle_left = handle.lerp(goal, strength)
+
+                handle = point.handle_right
                 vec = handle - co
                 length = vec.length
                 if length == 0.0:
-                    sign = sign_hint
+                    sign = 1.0
                     length = 0.0001
                 else:
                     sign = 1.0 if vec.dot(axis_vec) >= 0.0 else -1.0
-                target = co + axis_vec * length * sign
-                setattr(point, side_name, handle.lerp(target, settings.strength))
+                goal = co + axis_vec * length * sign
+                point.handle_right = handle.lerp(goal, strength)
 
-            _set_handle_type(point, settings.handle_type)
+                _set_handle_type(point, handle_type)
 
         _refresh_curve_data(context, obj)
-        self.report({"INFO"}, f"Aligned {len(points)} points")
+        self.report({"INFO"}, f"Aligned {total_points} points")
         return {"FINISHED"}
 
 
@@ -264,32 +469,79 @@ class SCH_OT_flatten(Operator):
 
         settings = context.scene.sch_settings
         obj = _active_curve_object(context)
-        axis_vec = _axis_local_vector(context, obj, settings.axis, settings.axis_space)
+        mw_inv_3x3 = obj.matrix_world.to_3x3().inverted_safe()
+        axis_vec = _axis_local_vector(context, settings.axis, settings.axis_space, mw_inv_3x3)
         if axis_vec is None:
             self.report({"ERROR"}, ERR_VIEW_AXIS)
             return {"CANCELLED"}
 
-        points = list(_iter_target_points(obj, settings.target))
-        if not points:
+        target = settings.target
+        arrays = _target_spline_arrays(obj, target)
+        total_points = _count_target_points(arrays)
+        if total_points == 0:
             self.report({"WARNING"}, ERR_NO_BEZIER)
             return {"CANCELLED"}
 
+        strength = settings.strength
+        handle_type = settings.handle_type
+        if strength == 0.0:
+            _apply_handle_types_only(obj, target, arrays, total_points, handle_type)
+            _refresh_curve_data(context, obj)
+            self.report({"INFO"}, f"Flattened {total_points} points")
+            return {"FINISHED"}
+
         target_dot = _flatten_target_dot(
-            points=points,
+            arrays=arrays,
+            total_points=total_points,
             axis_vec=axis_vec,
             flatten_reference=settings.flatten_reference,
             obj=obj,
             context=context,
+            target=target,
+            mw_inv=obj.matrix_world.inverted_safe(),
         )
 
-        for point in points:
-            point.co = _flatten_vector(point.co, axis_vec, target_dot, settings.strength)
-            point.handle_left = _flatten_vector(point.handle_left, axis_vec, target_dot, settings.strength)
-            point.handle_right = _flatten_vector(point.handle_right, axis_vec, target_dot, settings.strength)
-            _set_handle_type(point, settings.handle_type)
+        axis_col = _canonical_axis_index(axis_vec)
+        if total_points >= _VECTORIZE_MIN_POINTS:
+            axis_np = np.array(axis_vec, dtype=np.float32)
+            for spline, mask, co, handle_left, handle_right in arrays:
+                for arr in (co, handle_left, handle_right):
+                    if axis_col is not None:
+                        # A unit axis reduces the projection to one strided
+                        # column update with no broadcast temporaries.
+                        column = arr[:, axis_col]
+                        delta = (target_dot - column) * strength
+                        if mask is None:
+                            column += delta
+                        else:
+                            column[mask] += delta[mask]
+                        continue
+                    delta = (target_dot - arr @ axis_np) * strength
+                    moved = arr + axis_np * delta[:, None]
+                    if mask is None:
+                        arr[:] = moved
+                    else:
+                        arr[mask] = moved[mask]
+                _write_spline_arrays(spline, co, handle_left, handle_right)
+                _apply_handle_types(spline, mask, handle_type)
+        elif axis_col is not None:
+            for point in _iter_target_points(obj, target):
+                co = point.co
+                co[axis_col] += (target_dot - co[axis_col]) * strength
+                handle = point.handle_left
+                handle[axis_col] += (target_dot - handle[axis_col]) * strength
+                handle = point.handle_right
+                handle[axis_col] += (target_dot - handle[axis_col]) * strength
+                _set_handle_type(point, handle_type)
+        else:
+            for point in _iter_target_points(obj, target):
+                point.co = _flatten_vector(point.co, axis_vec, target_dot, strength)
+                point.handle_left = _flatten_vector(point.handle_left, axis_vec, target_dot, strength)
+                point.handle_right = _flatten_vector(point.handle_right, axis_vec, target_dot, strength)
+                _set_handle_type(point, handle_type)
 
         _refresh_curve_data(context, obj)
-        self.report({"INFO"}, f"Flattened {len(points)} points")
+        self.report({"INFO"}, f"Flattened {total_points} points")
         return {"FINISHED"}
 
 
@@ -310,42 +562,109 @@ class SCH_OT_equalize_length(Operator):
 
         settings = context.scene.sch_settings
         obj = _active_curve_object(context)
-        axis_vec = _axis_local_vector(context, obj, settings.axis, settings.axis_space)
+        mw_inv_3x3 = obj.matrix_world.to_3x3().inverted_safe()
+        axis_vec = _axis_local_vector(context, settings.axis, settings.axis_space, mw_inv_3x3)
         if axis_vec is None:
             self.report({"ERROR"}, ERR_VIEW_AXIS)
             return {"CANCELLED"}
 
-        points = list(_iter_target_points(obj, settings.target))
-        if not points:
+        target = settings.target
+        arrays = _target_spline_arrays(obj, target)
+        total_points = _count_target_points(arrays)
+        if total_points == 0:
             self.report({"WARNING"}, ERR_NO_BEZIER)
             return {"CANCELLED"}
 
-        lengths = []
-        for point in points:
-            lengths.append((point.handle_left - point.co).length)
-            lengths.append((point.handle_right - point.co).length)
-
-        non_zero = [value for value in lengths if value > 0.0]
-        if not non_zero:
-            self.report({"WARNING"}, "No non-zero handle lengths in target.")
-            return {"CANCELLED"}
-        target_len = sum(non_zero) / len(non_zero)
-
-        for point in points:
-            for side_name, sign_hint in (("handle_left", -1.0), ("handle_right", 1.0)):
-                handle = getattr(point, side_name)
-                vec = handle - point.co
-                if vec.length > 0.0:
-                    direction = vec.normalized()
+        strength = settings.strength
+        handle_type = settings.handle_type
+        if strength == 0.0:
+            _apply_handle_types_only(obj, target, arrays, total_points, handle_type)
+            _refresh_curve_data(context, obj)
+            self.report({"INFO"}, f"Equalized {total_points} points")
+            return {"FINISHED"}
+        if total_points >= _VECTORIZE_MIN_POINTS:
+            axis_np = np.array(axis_vec, dtype=np.float32)
+
+            # First pass: handle vectors and lengths per spline, plus the
+            # mean of all non-zero target lengths.
+            per_spline = []
+            length_sum = 0.0
+            length_count = 0
+            for spline, mask, co, handle_left, handle_right in arrays:
+                vec_left = handle_left - co
+                vec_right = handle_right - co
+                len_left = np.linalg.norm(vec_left, axis=1)
+                len_right = np.linalg.norm(vec_right, axis=1)
+                if mask is None:
+                    non_zero = np.concatenate((len_left, len_right))
                 else:
-                    direction = axis_vec * sign_hint
-                target = point.co + direction * target_len
-                setattr(point, side_name, handle.lerp(target, settings.strength))
+                    non_zero = np.concatenate((len_left[mask], len_right[mask]))
+                non_zero = non_zero[non_zero > 0.0]
+                length_sum += float(non_zero.sum())
+                length_count += non_zero.shape[0]
+                per_spline.append((vec_left, vec_right, len_left, len_right))
+
+            if length_count == 0:
+                self.report({"WARNING"}, "No non-zero handle lengths in target.")
+                return {"CANCELLED"}
+            target_len = length_sum / length_count
+
+            for entry, vecs in zip(arrays, per_spline):
+                spline, mask, co, handle_left, handle_right = entry
+                vec_left, vec_right, len_left, len_right = vecs
+                for handle, vec, length, sign_hint in (
+                    (handle_left, vec_left, len_left, -1.0),
+                    (handle_right, vec_right, len_right, 1.0),
+                ):
+                    safe_length = np.where(length > 0.0, length, 1.0)
+                    direction = np.where(
+                        (length > 0.0)[:, None],
+                        vec / safe_length[:, None],
+                        axis_np * sign_hint,
+                    )
+                    goal = co + direction * target_len
+                    moved = handle + (goal - handle) * strength
+                    if mask is None:
+                        handle[:] = moved
+                    else:
+                        handle[mask] = moved[mask]
+                _write_spline_arrays(spline, co, handle_left, handle_right)
+                _apply_handle_types(spline, mask, handle_type)
+        else:
+            # Same two passes as the array path, but as running scalar
+            # accumulation rather than an intermediate length list.
+            length_sum = 0.0
+            length_count = 0
+            for point in _iter_target_points(obj, target):
+                co = point.co
+                for handle in (point.handle_left, point.handle_right):
+                    length = (handle - co).length
+                    if length > 0.0:
+                        length_sum += length
+                        length_count += 1
+
+            if length_count == 0:
+                self.report({"WARNING"}, "No non-zero handle lengths in target.")
+                return {"CANCELLED"}
+            target_len = length_sum / length_count
+
+            for point in _iter_target_points(obj, target):
+                co = point.co
+
+                handle = point.handle_left
+                vec = handle - co
+                direction = vec.normalized() if vec.length > 0.0 else -axis_vec
+                point.handle_left = handle.lerp(co + direction * target_len, strength)
+
+                handle = point.handle_right
+                vec = handle - co
+                direction = vec.normalized() if vec.length > 0.0 else axis_vec
+                point.handle_right = handle.lerp(co + direction * target_len, strength)
 
-            _set_handle_type(point, settings.handle_type)
+                _set_handle_type(point, handle_type)
 
         _refresh_curve_data(context, obj)
-        self.report({"INFO"}, f"Equalized {len(points)} points")
+        self.report({"INFO"}, f"Equalized {total_points} points")
         return {"FINISHED"}
 
 